@@ -0,0 +1,84 @@
+"""Compare non-streaming chat completion responses: old per-character StreamingResponse vs raw bytes.
+
+Drives both Response objects through a counting ASGI `send`, so it measures the
+app side of the write path (latency, writes, bytes/sec) without a network.
+
+    uv run python bench/bench_non_stream.py [--content-chars 3000] [--iterations 200]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+
+
+def completion_body(content_chars: int) -> bytes:
+    return json.dumps({
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "x" * content_chars}}],
+        "usage": {"prompt_tokens": 50, "completion_tokens": content_chars // 4, "total_tokens": 50 + content_chars // 4},
+    }).encode()
+
+
+def old_response(body: bytes):
+    # Previous behaviour: model_dump_json() (a str) wrapped in StreamingResponse
+    return StreamingResponse(body.decode(), media_type="application/json")
+
+
+def new_response(body: bytes):
+    return Response(content=body, media_type="application/json")
+
+
+async def run_once(make_response, body: bytes):
+    writes = 0
+    sent = 0
+
+    async def receive():
+        # Never report a disconnect while the response is being written
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal writes, sent
+        if message["type"] == "http.response.body":
+            writes += 1
+            sent += len(message.get("body", b""))
+        await asyncio.sleep(0)
+
+    scope = {"type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1", "method": "POST", "headers": []}
+    start = time.perf_counter()
+    await make_response(body)(scope, receive, send)
+    return time.perf_counter() - start, writes, sent
+
+
+async def bench(name: str, make_response, body: bytes, iterations: int):
+    latencies = []
+    for _ in range(iterations):
+        elapsed, writes, sent = await run_once(make_response, body)
+        latencies.append(elapsed)
+    mean = statistics.mean(latencies)
+    p99 = sorted(latencies)[int(0.99 * (len(latencies) - 1))]
+    print(
+        f"{name:>4}: {writes:>6} writes/response  "
+        f"mean {mean * 1e6:10.1f} us  p99 {p99 * 1e6:10.1f} us  "
+        f"{sent / mean / 1e6:10.2f} MB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--content-chars", type=int, default=3000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    body = completion_body(args.content_chars)
+    print(f"response body: {len(body)} bytes, {args.iterations} iterations")
+    asyncio.run(bench("old", old_response, body, args.iterations))
+    asyncio.run(bench("new", new_response, body, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
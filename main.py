@@ -1,7 +1,12 @@
 import uvicorn
 import os
+import sys
 from src import app
+from src.server import run_production
 
 if __name__ == "__main__":
     env = os.environ
-    uvicorn.run("src:app", host="0.0.0.0", port=80, reload=True)
+    if env.get("APP_ENV") == "production" or "--prod" in sys.argv:
+        run_production()
+    else:
+        uvicorn.run("src:app", host="0.0.0.0", port=80, reload=True)
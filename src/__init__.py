@@ -1,10 +1,12 @@
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 import json
 import os
 from typing import Optional
 from fastapi import FastAPI, Request, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, PlainTextResponse
 
 from fastapi import WebSocket
@@ -12,7 +14,12 @@ from twilio.twiml.voice_response import VoiceResponse, Dial
 from vapi import AsyncVapi
 import logging
 from src.routes import gptRouter
-# from src.routes import vapiRouter
+from src.routes import vapiRouter
+from src.routes import adminRouter
+from src.componenets.vapiAI.vapiEventStore import event_store
+from src.componenets.assistants.assistantRegistry import assistant_registry
+from src.utils.drain import drain_coordinator
+from src.server import DRAIN_TIMEOUT
 # from src.componenets.customLLMs.gpt4o import custom_llm_test
 
 
@@ -22,7 +29,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Nothing is running yet if this fails; everything started below is stopped in the finally
+    drain_coordinator.install_signal_hooks()
+    await event_store.start()
+    try:
+        assistant_registry.start_watching()
+        yield
+        # Let active calls finish before the event store (which records their summaries) closes
+        await drain_coordinator.drain(DRAIN_TIMEOUT)
+    finally:
+        await assistant_registry.stop_watching()
+        await event_store.stop()
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "*",
@@ -35,9 +56,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compresses large JSON bodies; SSE (text/event-stream) responses are left uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 @app.get("/health")
 def hello():
+    if drain_coordinator.draining:
+        return JSONResponse(status_code=503, content={"status": "draining"})
     return {"status": "ok"}
 
-app.include_router(gptRouter.router, prefix="/custom-llm-test", tags=["custom-llm-test"])
\ No newline at end of file
+app.include_router(gptRouter.router, prefix="/custom-llm-test", tags=["custom-llm-test"])
+app.include_router(vapiRouter.router, prefix="/vapi", tags=["vapi"])
+app.include_router(adminRouter.router, prefix="/admin", tags=["admin"])
\ No newline at end of file
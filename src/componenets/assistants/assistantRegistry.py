@@ -0,0 +1,159 @@
+import os
+import json
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[3] / "assistants.json"
+SAMPLING_FIELDS = ("temperature", "max_tokens", "top_p", "frequency_penalty", "presence_penalty", "stop", "seed")
+# Sampling params a Gemini Live session accepts, mapped to their LiveConnectConfig names
+LIVE_SAMPLING_FIELDS = {"temperature": "temperature", "top_p": "top_p", "max_tokens": "max_output_tokens", "seed": "seed"}
+PROVIDERS = ("openai", "gemini")
+
+
+@dataclass(frozen=True)
+class CompiledAssistant:
+    """An assistant with everything derivable from its config prepared once at load time."""
+    assistant_id: str
+    provider: str
+    model: str
+    system_prompt: str
+    system_message: Optional[Dict[str, str]]
+    sampling: Mapping[str, Any]
+    tools: Tuple[Mapping[str, Any], ...]
+    request_template: Mapping[str, Any]
+
+    def build_messages(self, messages: list) -> list:
+        """Prefix the conversation with the precompiled system message."""
+        if self.system_message is None:
+            return list(messages)
+        return [self.system_message, *messages]
+
+
+def compile_assistant(assistant_id: str, spec: Dict[str, Any]) -> CompiledAssistant:
+    """Validate one assistant entry and precompute its prompt and request template."""
+    model = spec.get("model")
+    if not model:
+        raise ValueError(f"Assistant '{assistant_id}' is missing 'model'")
+
+    provider = spec.get("provider", "openai")
+    if provider not in PROVIDERS:
+        raise ValueError(f"Assistant '{assistant_id}' has unknown provider '{provider}'")
+
+    system_prompt = (spec.get("system_prompt") or "").strip()
+    sampling = dict(spec.get("sampling") or {})
+    allowed = LIVE_SAMPLING_FIELDS if provider == "gemini" else SAMPLING_FIELDS
+    unknown = set(sampling) - set(allowed)
+    if unknown:
+        raise ValueError(f"Assistant '{assistant_id}' has unsupported sampling params for {provider}: {sorted(unknown)}")
+    tools = tuple(spec.get("tools") or ())
+    if tools and provider == "gemini":
+        # The Live session has nothing to answer tool calls with, so a call would stall the turn
+        raise ValueError(f"Assistant '{assistant_id}' uses tools, which the Gemini Live path does not support")
+
+    request_template = {"model": model, **sampling}
+    if tools:
+        request_template["tools"] = list(tools)
+
+    return CompiledAssistant(
+        assistant_id=assistant_id,
+        provider=provider,
+        model=model,
+        system_prompt=system_prompt,
+        # Plain dict so the SDKs can serialize it; shared read-only across requests
+        system_message={"role": "system", "content": system_prompt} if system_prompt else None,
+        sampling=MappingProxyType(sampling),
+        tools=tools,
+        request_template=MappingProxyType(request_template),
+    )
+
+
+class AssistantRegistry:
+    """Assistants loaded from a JSON config, swapped atomically on reload.
+
+    Every load compiles a brand new snapshot and replaces the reference in one
+    assignment, so readers never take a lock and anything already holding a
+    CompiledAssistant keeps using it until it finishes.
+    """
+
+    def __init__(self, config_path: Optional[str] = None):
+        self.config_path = Path(config_path or os.getenv("ASSISTANTS_CONFIG", DEFAULT_CONFIG_PATH))
+        # (assistants by ID, default ID) - replaced as a whole, never mutated
+        self._snapshot: Tuple[Mapping[str, CompiledAssistant], Optional[str]] = (MappingProxyType({}), None)
+        self._mtime: Optional[float] = None
+        self._watch_task: Optional[asyncio.Task] = None
+        self.load()
+
+    def load(self):
+        """Load and compile the config file, replacing the current snapshot."""
+        mtime = self.config_path.stat().st_mtime
+        with open(self.config_path) as f:
+            config = json.load(f)
+
+        assistants = {
+            assistant_id: compile_assistant(assistant_id, spec)
+            for assistant_id, spec in config.get("assistants", {}).items()
+        }
+        default_id = config.get("default")
+        if default_id not in assistants:
+            raise ValueError(f"Default assistant '{default_id}' is not defined")
+
+        # Single reference swap; a reader sees either the old snapshot or the new one
+        self._snapshot = (MappingProxyType(assistants), default_id)
+        self._mtime = mtime
+        logger.info(f"Loaded {len(assistants)} assistants from {self.config_path}")
+
+    def reload(self) -> bool:
+        """Reload if the config file changed. Keeps the current snapshot if the new one is invalid."""
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError as e:
+            logger.error(f"Cannot stat assistants config {self.config_path}: {e}")
+            return False
+        if mtime == self._mtime:
+            return False
+        try:
+            self.load()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to reload assistants from {self.config_path}: {e}")
+            # Don't retry the same broken file on every poll
+            self._mtime = mtime
+            return False
+
+    def get(self, assistant_id: Optional[str] = None) -> CompiledAssistant:
+        """Return an assistant by ID, or the default one. Raises KeyError if unknown."""
+        assistants, default_id = self._snapshot
+        return assistants[assistant_id or default_id]
+
+    def __contains__(self, assistant_id: str) -> bool:
+        return assistant_id in self._snapshot[0]
+
+    async def watch(self, interval: float = 2.0):
+        """Poll the config file and hot reload it when it changes."""
+        while True:
+            await asyncio.sleep(interval)
+            if self.reload():
+                logger.info("Assistant registry hot reloaded")
+
+    def start_watching(self, interval: float = 2.0):
+        if not self._watch_task:
+            self._watch_task = asyncio.create_task(self.watch(interval))
+
+    async def stop_watching(self):
+        if self._watch_task:
+            self._watch_task.cancel()
+            await asyncio.gather(self._watch_task, return_exceptions=True)
+            self._watch_task = None
+
+
+assistant_registry = AssistantRegistry()
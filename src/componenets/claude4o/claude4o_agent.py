@@ -1,10 +1,13 @@
 import os
 from anthropic import AsyncAnthropic
 from openai import AsyncOpenAI
+from src.componenets.assistants.assistantRegistry import assistant_registry
 class Claude4oAgent:
-    def __init__(self, api_key: str = None, model: str = "gpt-4o"):
+    def __init__(self, api_key: str = None, model: str = None, assistant_id: str = "claude4o"):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         # self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self.assistant_id = assistant_id
+        # Explicit model overrides the assistant config; otherwise it follows hot reloads
         self.model = model
         # self.client = AsyncAnthropic(api_key=self.api_key)
         self.client = AsyncOpenAI(api_key=self.api_key)
@@ -17,11 +20,16 @@ class Claude4oAgent:
     #         messages=messages
     #     )
     #     return response.content 
-    async def get_completion(self, messages, max_tokens=1024):
+    async def get_completion(self, messages, max_tokens=None):
         # messages: list of {"role": "user"/"assistant", "content": str}
+        assistant = assistant_registry.get(self.assistant_id)
+        params = dict(assistant.request_template)
+        if self.model:
+            params["model"] = self.model
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
         response = await self.client.chat.completions.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            messages=messages
+            messages=assistant.build_messages(messages),
+            **params
         )
         return response.choices[0].message.content
\ No newline at end of file
@@ -1,13 +1,48 @@
 import os 
 import logging
+from numbers import Real
 from fastapi import FastAPI, APIRouter, Request, Response
 from openai import AsyncOpenAI
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, JSONResponse
 from anthropic import AsyncAnthropic
+from src.componenets.assistants.assistantRegistry import assistant_registry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chat completion fields forwarded upstream; anything else Vapi sends (call, customer, metadata...) is dropped.
+# 'model' is deliberately absent: Vapi always sends one, and the selected assistant's model must win.
+REQUEST_FIELDS = {
+    "max_tokens": lambda v: isinstance(v, int) and not isinstance(v, bool) and v > 0,
+    "temperature": lambda v: isinstance(v, Real) and not isinstance(v, bool) and 0 <= v <= 2,
+    "top_p": lambda v: isinstance(v, Real) and not isinstance(v, bool) and 0 <= v <= 1,
+    "frequency_penalty": lambda v: isinstance(v, Real) and not isinstance(v, bool) and -2 <= v <= 2,
+    "presence_penalty": lambda v: isinstance(v, Real) and not isinstance(v, bool) and -2 <= v <= 2,
+    "seed": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "stop": lambda v: isinstance(v, str) or (isinstance(v, list) and all(isinstance(i, str) for i in v)),
+    "tools": lambda v: isinstance(v, list),
+    "tool_choice": lambda v: isinstance(v, (str, dict)),
+    "response_format": lambda v: isinstance(v, dict),
+    "user": lambda v: isinstance(v, str),
+}
+
+
+def validate_request_fields(request_data) -> dict:
+    """Return the whitelisted, non-null request fields, raising ValueError on a bad value."""
+    messages = request_data.get("messages")
+    if not isinstance(messages, list) or not all(isinstance(m, dict) and "role" in m for m in messages):
+        raise ValueError("'messages' must be a list of objects with a 'role'")
+
+    fields = {}
+    for field, is_valid in REQUEST_FIELDS.items():
+        value = request_data.get(field)
+        if value is None:
+            continue
+        if not is_valid(value):
+            raise ValueError(f"Invalid value for '{field}'")
+        fields[field] = value
+    return fields
+
 class OpenAIgpt4o:
     def __init__(self):
         self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
@@ -26,29 +61,36 @@ class OpenAIgpt4o:
         logger.info(f"Request: {request_data}")
         streaming = request_data.get("stream", True)
 
-        prompt = f"""
-        your name is DemoProductAgent
-        You are a helpful assistant that can answer questions and help with tasks.
-        You are given a prompt and you need to answer the question or help with the task.
-        """
+        assistant_id = request_data.get("assistant_id")
+        if assistant_id is not None and not isinstance(assistant_id, str):
+            return JSONResponse(status_code=400, content={"error": "'assistant_id' must be a string"})
+        if assistant_id and assistant_id not in assistant_registry:
+            return JSONResponse(status_code=400, content={"error": f"Unknown assistant '{assistant_id}'"})
+        assistant = assistant_registry.get(assistant_id)
+        if assistant.provider != "openai":
+            return JSONResponse(
+                status_code=400,
+                content={"error": f"Assistant '{assistant.assistant_id}' uses provider '{assistant.provider}', not 'openai'"},
+            )
 
-        messages = [
-            {"role": "system", "content": prompt}
-        ]
+        # Compiled defaults for the assistant; the caller may override sampling params but not the model
+        try:
+            overrides = validate_request_fields(request_data)
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": str(e)})
+        params = {**assistant.request_template, **overrides}
+        messages = assistant.build_messages(request_data.get("messages"))
 
         print("request_data", request_data)
         if streaming:
             chat_completion_stream = await self.client.chat.completions.create(
-                model=request_data.get("model"),
-                messages=request_data.get("messages") + messages,
-                max_tokens=request_data.get("max_tokens"),
-                temperature=request_data.get("temperature"),
-                stream=True
+                messages=messages,
+                stream=True,
+                **params
             )
             return StreamingResponse(self.stream_response(chat_completion_stream), media_type="text/event-stream")
         
         else:
-            chat_completion = await self.client.chat.completions.create(**request_data)
-            return StreamingResponse(chat_completion.model_dump_json(), media_type="application/json")
-    
-
+            # Pass the upstream JSON bytes through untouched instead of parsing and re-serializing them
+            raw = await self.client.chat.completions.with_raw_response.create(messages=messages, **params)
+            return Response(content=raw.content, media_type="application/json")
@@ -1,28 +1,172 @@
 import asyncio
+import logging
+import time
+from collections import deque
+from typing import Callable, Optional
 from google import genai
 from google.genai import types
+from src.utils.dataclass import LiveResumptionState
+from src.componenets.assistants.assistantRegistry import assistant_registry, CompiledAssistant, LIVE_SAMPLING_FIELDS
+
+logger = logging.getLogger(__name__)
 
 class GeminiClient:
-    def __init__(self, api_key:str):
+    def __init__(
+        self,
+        api_key:str,
+        assistant_id: str = "gemini-live-demo",
+        max_reconnects: int = 5,
+        reconnect_delay: float = 0.5,
+        max_buffered_chunks: int = 500,
+        compression_trigger_tokens: int = 25600,
+        compression_target_tokens: int = 12800,
+    ):
         self.client = genai.Client(api_key=api_key)
-        self.model = "models/gemini-2.5-flash-preview-native-audio-dialog"
+        self.assistant_id = assistant_id
+        self.max_reconnects = max_reconnects
+        self.reconnect_delay = reconnect_delay  # seconds
+        self.max_buffered_chunks = max_buffered_chunks
+        self.compression_trigger_tokens = compression_trigger_tokens
+        self.compression_target_tokens = compression_target_tokens
 
-    async def run_session(self, mic_audio_gen, on_audio_out):
-        config = types.LiveConnectConfig(
+    def _build_config(self, assistant: CompiledAssistant, handle: Optional[str]) -> types.LiveConnectConfig:
+        return types.LiveConnectConfig(
             response_modalities=[types.Modality.AUDIO],
-            system_instruction="You are a demo assistant that pitches the product concisely."
+            system_instruction=assistant.system_prompt,
+            **{LIVE_SAMPLING_FIELDS[name]: value for name, value in assistant.sampling.items()},
+            session_resumption=types.SessionResumptionConfig(handle=handle),
+            context_window_compression=types.ContextWindowCompressionConfig(
+                trigger_tokens=self.compression_trigger_tokens,
+                sliding_window=types.SlidingWindow(target_tokens=self.compression_target_tokens),
+            ),
         )
-        async with self.client.aio.live.connect(model=self.model, config=config) as sess:
-            send = asyncio.create_task(self._send(sess, mic_audio_gen))
-            recv = asyncio.create_task(self._recv(sess, on_audio_out))
-            await asyncio.gather(send, recv)
 
-    async def _send(self, sess, gen):
-        async for pcm in gen():
+    async def run_session(
+        self,
+        mic_audio_gen,
+        on_audio_out,
+        on_reconnect: Optional[Callable[[float], None]] = None,
+        on_audio_sent: Optional[Callable[[int], None]] = None,
+        on_turn_complete: Optional[Callable[[], None]] = None,
+    ):
+        # Resolved once per call so a hot reload never changes the assistant mid-call
+        assistant = assistant_registry.get(self.assistant_id)
+        if assistant.provider != "gemini":
+            raise ValueError(f"Assistant '{assistant.assistant_id}' uses provider '{assistant.provider}', not 'gemini'")
+
+        # Mic audio is pumped into a buffer that outlives any single Live connection,
+        # so audio keeps accumulating while we reconnect.
+        state = LiveResumptionState()
+        buffer = deque(maxlen=self.max_buffered_chunks)
+        has_audio = asyncio.Event()
+        pump = asyncio.create_task(self._pump(mic_audio_gen, buffer, has_audio))
+        gap_start = None
+        failures = 0
+
+        try:
+            while True:
+                try:
+                    async with self.client.aio.live.connect(model=assistant.model, config=self._build_config(assistant, state.handle)) as sess:
+                        if gap_start is not None:
+                            state.reconnects += 1
+                            state.last_gap_seconds = time.monotonic() - gap_start
+                            state.total_gap_seconds += state.last_gap_seconds
+                            gap_start = None
+                            logger.info(
+                                f"Gemini Live reconnected (resumed={state.handle is not None}) "
+                                f"after {state.last_gap_seconds * 1000:.0f} ms gap, {len(buffer)} chunks buffered"
+                            )
+                            if on_reconnect:
+                                on_reconnect(state.last_gap_seconds)
+
+                        # Set once the server sends anything, i.e. it actually accepted this session
+                        accepted = asyncio.Event()
+                        send = asyncio.create_task(self._send(sess, buffer, has_audio, pump, on_audio_sent))
+                        recv = asyncio.create_task(self._recv(sess, on_audio_out, state, on_turn_complete, accepted))
+                        try:
+                            done, _ = await asyncio.wait({send, recv}, return_when=asyncio.FIRST_COMPLETED)
+                        finally:
+                            # Also runs if run_session itself is cancelled, so neither task outlives the session
+                            send.cancel()
+                            recv.cancel()
+                            await asyncio.gather(send, recv, return_exceptions=True)
+
+                        if send in done and send.exception() is None:
+                            # Mic input finished and everything buffered was sent
+                            return
+                        for task in done:
+                            if task.exception():
+                                logger.warning(f"Gemini Live connection lost: {task.exception()}")
+                        if not accepted.is_set():
+                            raise ConnectionError("Gemini Live session closed before the server sent anything")
+                        failures = 0
+                except Exception as e:
+                    failures += 1
+                    logger.warning(f"Gemini Live connect failed ({failures}/{self.max_reconnects}): {e}")
+                    if state.handle is not None:
+                        # The handle may have been rejected or expired; start a fresh session next time
+                        logger.info("Dropping Gemini Live resumption handle after failed resume")
+                        state.handle = None
+                    if failures >= self.max_reconnects:
+                        raise
+
+                if pump.done() and not buffer:
+                    return
+                if gap_start is None:
+                    gap_start = time.monotonic()
+                await asyncio.sleep(self.reconnect_delay)
+        finally:
+            if not pump.done():
+                pump.cancel()
+                await asyncio.gather(pump, return_exceptions=True)
+
+    async def _pump(self, gen, buffer, has_audio):
+        try:
+            async for pcm in gen():
+                if len(buffer) == buffer.maxlen:
+                    logger.warning("Gemini audio buffer full, dropping oldest chunk")
+                buffer.append(pcm)
+                has_audio.set()
+        finally:
+            has_audio.set()
+
+    async def _send(self, sess, buffer, has_audio, pump, on_audio_sent=None):
+        while True:
+            if not buffer:
+                if pump.done():
+                    return
+                has_audio.clear()
+                await has_audio.wait()
+                continue
+            pcm = buffer.popleft()
             blob = types.Blob(data=pcm, mime_type="audio/pcm;rate=16000")
-            await sess.send_realtime_input(audio=blob)
+            try:
+                await sess.send_realtime_input(audio=blob)
+            except BaseException:
+                # Failed or cancelled mid-send (e.g. recv saw go-away): keep the chunk for the next connection
+                buffer.appendleft(pcm)
+                raise
+            if on_audio_sent:
+                on_audio_sent(len(pcm))
 
-    async def _recv(self, sess, on_audio_out):
-        async for resp in sess.receive():
-            if resp.data:
-                on_audio_out(resp.data)
+    async def _recv(self, sess, on_audio_out, state, on_turn_complete=None, accepted=None):
+        # receive() yields a single turn, so keep reading turns until the connection goes away
+        while True:
+            got_message = False
+            async for resp in sess.receive():
+                got_message = True
+                if accepted:
+                    accepted.set()
+                update = resp.session_resumption_update
+                if update and update.resumable and update.new_handle:
+                    state.handle = update.new_handle
+                if resp.go_away:
+                    logger.info(f"Gemini Live go-away received, time left: {resp.go_away.time_left}")
+                    return
+                if resp.data:
+                    on_audio_out(resp.data)
+                content = resp.server_content
+                if on_turn_complete and content and (content.turn_complete or content.interrupted):
+                    on_turn_complete()
+            if not got_message:
+                raise ConnectionError("Gemini Live session closed")
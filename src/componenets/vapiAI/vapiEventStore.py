@@ -0,0 +1,200 @@
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, Tuple
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class VapiEventStore:
+    """Append-only SQLite (WAL) store for Vapi call events with batched group commits."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_queue_size: int = 50000,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+    ):
+        self.db_path = db_path or os.getenv("VAPI_EVENT_DB", "vapi_events.db")
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval  # seconds
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self.dropped_events = 0
+
+    async def start(self):
+        """Open the database and start the background writer."""
+        if self._writer_task:
+            return
+        self._conn = await asyncio.to_thread(self._open)
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._writer_task = asyncio.create_task(self._writer())
+        logger.info(f"Vapi event store started: {self.db_path}")
+
+    async def stop(self):
+        """Flush pending events, stop the writer and close the database."""
+        if not self._writer_task:
+            return
+        await self._queue.put(None)
+        await self._writer_task
+        self._writer_task = None
+        await asyncio.to_thread(self._conn.close)
+        self._conn = None
+        logger.info("Vapi event store stopped")
+
+    @property
+    def running(self) -> bool:
+        return self._writer_task is not None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS call_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                call_id TEXT,
+                event_type TEXT,
+                ts REAL NOT NULL,
+                payload TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_call_events_call_ts ON call_events (call_id, ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_call_events_ts ON call_events (ts)")
+        return conn
+
+    def enqueue(self, call_id: Optional[str], event_type: Optional[str], payload: str, ts: Optional[float] = None) -> bool:
+        """Queue an event for persistence without waiting on disk. Returns False if it was dropped."""
+        if not self._queue:
+            logger.warning("Vapi event store is not started; dropping event")
+            self.dropped_events += 1
+            return False
+        try:
+            self._queue.put_nowait((call_id, event_type, ts if ts is not None else time.time(), payload))
+            return True
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            return False
+
+    def enqueue_message(self, message: Dict[str, Any], call_id: Optional[str] = None) -> bool:
+        """Queue a decoded Vapi message, pulling call id, type and timestamp out of it."""
+        event_call_id, event_type, ts = self.extract_fields(message)
+        return self.enqueue(call_id or event_call_id, event_type, json.dumps(message), ts)
+
+    @staticmethod
+    def extract_fields(message: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[float]]:
+        """Return (call_id, type, timestamp in seconds) from a Vapi server message."""
+        call = message.get("call") or {}
+        call_id = call.get("id") if isinstance(call, dict) else None
+        ts = message.get("timestamp")
+        if isinstance(ts, (int, float)):
+            # Vapi sends epoch milliseconds
+            ts = ts / 1000.0 if ts > 1e11 else float(ts)
+        else:
+            ts = None
+        return call_id, message.get("type"), ts
+
+    async def _writer(self):
+        """Drain the queue in batches and commit each batch in a single transaction."""
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - asyncio.get_running_loop().time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} Vapi events: {e}")
+
+    def _write_batch(self, batch: List[Tuple]):
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT INTO call_events (call_id, event_type, ts, payload) VALUES (?, ?, ?, ?)",
+                batch,
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    async def query(
+        self,
+        call_id: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Return stored events filtered by call id and/or [start, end) epoch-second range."""
+        return await asyncio.to_thread(self._query, call_id, start, end, limit)
+
+    def _query(self, call_id, start, end, limit) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if call_id is not None:
+            clauses.append("call_id = ?")
+            params.append(call_id)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+
+        # Separate read connection so queries never wait on the writer's transaction;
+        # _open also creates the schema in case the writer hasn't started yet
+        conn = self._open()
+        try:
+            rows = conn.execute(
+                f"SELECT id, call_id, event_type, ts, payload FROM call_events {where} ORDER BY ts, id LIMIT ?",
+                params,
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [
+            {
+                "id": row[0],
+                "call_id": row[1],
+                "type": row[2],
+                "timestamp": row[3],
+                "payload": json.loads(row[4]),
+            }
+            for row in rows
+        ]
+
+
+event_store = VapiEventStore()
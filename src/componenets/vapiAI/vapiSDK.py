@@ -8,7 +8,10 @@ import struct
 from typing import Optional, Dict, Any, Callable, AsyncGenerator
 from vapi import AsyncVapi
 from src.componenets.geminiLive.geminiLiveAgent import GeminiClient
+from src.componenets.vapiAI.vapiEventStore import VapiEventStore, event_store as default_event_store
 from src.utils.dataclass import CallStatus, CallSession, AudioConfig
+from src.utils.callTelemetry import telemetry_registry
+from src.utils.drain import drain_coordinator
 
 # Configure logging
 logging.basicConfig(
@@ -21,7 +24,7 @@ logger = logging.getLogger(__name__)
 class VapiWebSocketAgent:
     """Production-ready Vapi WebSocket agent with Gemini integration."""
     
-    def __init__(self, assistant_id: str):
+    def __init__(self, assistant_id: str, event_store: Optional[VapiEventStore] = None):
         """Initialize the agent with required credentials and configuration."""
         # Validate environment variables
         self.vapi_token = os.getenv("VAPI_API_KEY")
@@ -39,18 +42,31 @@ class VapiWebSocketAgent:
         # Configuration
         self.audio_config = AudioConfig()
         self.active_sessions: Dict[str, CallSession] = {}
+        self.session_tasks: Dict[str, asyncio.Task] = {}
+        self.accepting_calls = True
+        self.drain_cleanup_reserve = 5  # seconds of the drain deadline kept for ending calls
         self.max_concurrent_calls = 10
         self.heartbeat_interval = 30  # seconds
         self.reconnect_attempts = 3
         self.reconnect_delay = 5  # seconds
         
+        # Persist control messages and call summaries to the app's event store by default
+        self.event_store = event_store if event_store is not None else default_event_store
+        
         # Callbacks
         self.on_call_started: Optional[Callable[[str], None]] = None
         self.on_call_ended: Optional[Callable[[str], None]] = None
         self.on_error: Optional[Callable[[str, Exception], None]] = None
+        
+        # Let the server drain this agent's calls on shutdown
+        drain_coordinator.register(self)
 
     async def start_call(self, customer_phone: Optional[str] = None) -> Optional[str]:
         """Start a new WebSocket call with the configured assistant."""
+        if not self.accepting_calls:
+            logger.warning("Agent is draining, refusing new call")
+            return None
+        
         try:
             # Prepare call request
             call_request = {
@@ -105,13 +121,16 @@ class VapiWebSocketAgent:
                 websocket_url=websocket_url,
                 status=CallStatus.INITIALIZING,
                 audio_input_queue=asyncio.Queue(maxsize=1000),
-                audio_output_queue=asyncio.Queue(maxsize=1000)
+                audio_output_queue=asyncio.Queue(maxsize=1000),
+                telemetry=telemetry_registry.start(call_id)
             )
             
             self.active_sessions[call_id] = session
             
             # Start handling the call
-            asyncio.create_task(self._handle_call_session(session))
+            task = asyncio.create_task(self._handle_call_session(session))
+            self.session_tasks[call_id] = task
+            task.add_done_callback(lambda _: self.session_tasks.pop(call_id, None))
             
             return call_id
             
@@ -210,14 +229,26 @@ class VapiWebSocketAgent:
                 """Handle audio output from Gemini."""
                 try:
                     if session.status == CallStatus.ACTIVE:
+                        session.telemetry.gemini_received(len(audio_data))
                         asyncio.create_task(
                             session.audio_output_queue.put(audio_data)
                         )
                 except Exception as e:
                     logger.error(f"Error queuing Gemini audio: {e}")
             
+            def on_gemini_reconnect(gap_seconds: float):
+                """Report how long the call was without a Gemini connection."""
+                logger.warning(f"Gemini session for call {call_id} resumed after {gap_seconds * 1000:.0f} ms gap")
+                session.telemetry.reconnected(gap_seconds)
+            
             # Run Gemini session
-            await self.gemini.run_session(audio_generator, on_gemini_audio)
+            await self.gemini.run_session(
+                audio_generator,
+                on_gemini_audio,
+                on_reconnect=on_gemini_reconnect,
+                on_audio_sent=session.telemetry.gemini_sent,
+                on_turn_complete=session.telemetry.end_turn
+            )
             
         except Exception as e:
             logger.error(f"Error in Gemini session for call {call_id}: {e}")
@@ -240,6 +271,7 @@ class VapiWebSocketAgent:
                     
                     # Send binary audio data to WebSocket
                     await session.websocket.send(audio_data)
+                    session.telemetry.vapi_sent(len(audio_data))
                     
                 except asyncio.TimeoutError:
                     continue
@@ -262,6 +294,7 @@ class VapiWebSocketAgent:
                 try:
                     if isinstance(message, bytes):
                         # Binary audio data
+                        session.telemetry.vapi_received(message)
                         await session.audio_input_queue.put(message)
                         
                     elif isinstance(message, str):
@@ -286,12 +319,17 @@ class VapiWebSocketAgent:
         
         logger.debug(f"Control message for call {call_id}: {message_type}")
         
+        if self.event_store:
+            self.event_store.enqueue_message(message, call_id=call_id)
+        
         if message_type == "call-started":
             logger.info(f"Call started: {call_id}")
             
         elif message_type == "call-ended":
             logger.info(f"Call ended: {call_id}")
             session.status = CallStatus.ENDING
+            # Close our side so the receive loop finishes and the session can clean up
+            await session.websocket.close()
             
         elif message_type == "error":
             error_msg = message.get("message", "Unknown error")
@@ -346,6 +384,13 @@ class VapiWebSocketAgent:
             # Update status
             session.status = CallStatus.ENDED
             
+            # Export call telemetry
+            summary = telemetry_registry.finish(call_id)
+            if summary:
+                logger.info(f"Call telemetry for {call_id}: {json.dumps(summary)}")
+                if self.event_store:
+                    self.event_store.enqueue(call_id, "telemetry-summary", json.dumps(summary))
+            
             # Remove from active sessions
             if call_id in self.active_sessions:
                 del self.active_sessions[call_id]
@@ -363,18 +408,54 @@ class VapiWebSocketAgent:
             for call_id, session in self.active_sessions.items()
         }
 
-    async def shutdown(self):
-        """Gracefully shutdown the agent."""
+    def stop_accepting(self):
+        """Refuse new calls while letting active ones continue."""
+        self.accepting_calls = False
+
+    async def drain(self, timeout: float = 30):
+        """Stop taking calls, let active calls finish, and shut down within `timeout` seconds overall."""
+        self.stop_accepting()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # Keep part of the budget for ending and cleaning up calls that are still running
+        cleanup_reserve = min(self.drain_cleanup_reserve, timeout / 4)
+        
+        tasks = list(self.session_tasks.values())
+        if tasks:
+            logger.info(f"Draining {len(tasks)} active calls (up to {timeout:.1f}s)...")
+            done, pending = await asyncio.wait(tasks, timeout=max(0.0, timeout - cleanup_reserve))
+            logger.info(f"Drain finished: {len(done)} calls completed, {len(pending)} still active")
+        await self.shutdown(timeout=max(0.0, deadline - loop.time()))
+
+    async def shutdown(self, timeout: float = 10):
+        """Gracefully shutdown the agent, taking at most `timeout` seconds."""
         logger.info("Shutting down Vapi WebSocket agent...")
+        self.stop_accepting()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # Cancelled sessions still need a moment to close their websockets
+        cancel_at = deadline - min(1.0, timeout / 4)
         
         # End all active calls
         call_ids = list(self.active_sessions.keys())
-        for call_id in call_ids:
-            await self.end_call(call_id)
+        if call_ids:
+            await asyncio.wait(
+                [asyncio.create_task(self.end_call(call_id)) for call_id in call_ids],
+                timeout=max(0.0, cancel_at - loop.time())
+            )
         
-        # Wait for cleanup
-        await asyncio.sleep(2)
+        # Wait for session cleanup, cancelling sessions that don't wind down in time
+        tasks = list(self.session_tasks.values())
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=max(0.0, cancel_at - loop.time()))
+            for task in pending:
+                task.cancel()
+            if pending:
+                _, stuck = await asyncio.wait(pending, timeout=max(0.0, deadline - loop.time()))
+                if stuck:
+                    logger.warning(f"{len(stuck)} call sessions did not finish cleanup before the deadline")
         
+        drain_coordinator.unregister(self)
         logger.info("Agent shutdown complete")
 
 # Example usage and configuration
@@ -0,0 +1,58 @@
+import os
+import json
+import asyncio
+import secrets
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from src.utils.callTelemetry import telemetry_registry
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def require_admin_token(x_admin_token: str = Header(default="")):
+    """Admin routes need X-Admin-Token to match ADMIN_TOKEN; they are disabled when it isn't set."""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(status_code=403, detail="Admin API is disabled (ADMIN_TOKEN not set)")
+    if not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+# Telemetry lives in each worker's memory, so with multiple workers these routes
+# only see calls handled by the worker that answers the request.
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+@router.get("/calls/telemetry")
+async def calls_telemetry():
+    return {
+        "active": [telemetry.summary() for telemetry in list(telemetry_registry.active.values())],
+        "recent": list(telemetry_registry.recent),
+    }
+
+@router.get("/calls/{call_id}/telemetry/stream")
+async def call_telemetry_stream(call_id: str, interval: float = 1.0, samples: int = 50):
+    if call_id not in telemetry_registry.active:
+        return JSONResponse(status_code=404, content={"error": f"No active call '{call_id}'"})
+
+    async def stream():
+        # First snapshot carries the newest `samples`; later ones only what was recorded since
+        last_index = None
+        while True:
+            telemetry = telemetry_registry.active.get(call_id)
+            if telemetry is None:
+                # Call finished; send its final summary and stop
+                final = next((s for s in reversed(telemetry_registry.recent) if s["call_id"] == call_id), None)
+                yield f"event: ended\ndata: {json.dumps(final)}\n\n"
+                return
+            new_samples = telemetry.samples(samples if last_index is None else None, after=last_index)
+            if new_samples:
+                last_index = new_samples[-1]["index"]
+            snapshot = {"summary": telemetry.summary(), "samples": new_samples}
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            await asyncio.sleep(max(interval, 0.1))
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
@@ -1,8 +1,14 @@
+import json
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 from src.componenets.customLLMs.gpt4o import OpenAIgpt4o
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib parser
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -16,7 +22,13 @@ gpt4o_agent = OpenAIgpt4o()
 
 @router.post("/chat/completions")
 async def chat_completions(request: Request):
-    data = await request.json()
+    body = await request.body()
+    try:
+        data = orjson.loads(body) if orjson else json.loads(body)
+    except ValueError:
+        return JSONResponse(status_code=400, content={"error": "Invalid JSON body"})
+    if not isinstance(data, dict):
+        return JSONResponse(status_code=400, content={"error": "Request body must be a JSON object"})
     messages = data.get("messages", [])
     if not messages:
         return JSONResponse(status_code=400, content={"error": "Missing 'messages' field"})
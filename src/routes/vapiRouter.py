@@ -0,0 +1,57 @@
+import os
+import json
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from src.componenets.vapiAI.vapiEventStore import event_store
+from src.routes.adminRouter import require_admin_token
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+async def require_vapi_secret(x_vapi_secret: str = Header(default="")):
+    """Webhooks need X-Vapi-Secret to match VAPI_WEBHOOK_SECRET; they are rejected when it isn't set."""
+    webhook_secret = os.getenv("VAPI_WEBHOOK_SECRET")
+    if not webhook_secret:
+        raise HTTPException(status_code=403, detail="Vapi webhook is disabled (VAPI_WEBHOOK_SECRET not set)")
+    if not secrets.compare_digest(x_vapi_secret, webhook_secret):
+        raise HTTPException(status_code=401, detail="Invalid Vapi secret")
+
+@router.post("/webhook", dependencies=[Depends(require_vapi_secret)])
+async def vapi_webhook(request: Request):
+    body = await request.body()
+    try:
+        data = json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return JSONResponse(status_code=400, content={"error": "Invalid JSON body"})
+
+    # Vapi server messages arrive wrapped as {"message": {...}}
+    message = data.get("message", data) if isinstance(data, dict) else None
+    if not isinstance(message, dict):
+        return JSONResponse(status_code=400, content={"error": "Missing 'message' field"})
+
+    if not event_store.running:
+        return JSONResponse(status_code=503, content={"error": "Event store not running"})
+    # Stored as the bare message, the same shape the agent records for its own events
+    if not event_store.enqueue_message(message):
+        return JSONResponse(status_code=503, content={"error": "Event queue full"})
+    return {"status": "accepted"}
+
+# Stored payloads include transcripts and customer numbers, so reading them back is an admin operation
+@router.get("/calls/{call_id}/events", dependencies=[Depends(require_admin_token)])
+async def call_events(call_id: str, start: Optional[float] = None, end: Optional[float] = None, limit: int = Query(1000, ge=1, le=10000)):
+    events = await event_store.query(call_id=call_id, start=start, end=end, limit=limit)
+    return {"call_id": call_id, "events": events}
+
+@router.get("/events", dependencies=[Depends(require_admin_token)])
+async def events(start: Optional[float] = None, end: Optional[float] = None, limit: int = Query(1000, ge=1, le=10000)):
+    results = await event_store.query(start=start, end=end, limit=limit)
+    return {"events": results}
@@ -0,0 +1,43 @@
+import os
+import importlib.util
+import logging
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+# Seconds in-flight streams and calls get to finish after a shutdown signal
+DRAIN_TIMEOUT = float(os.getenv("DRAIN_TIMEOUT_SECONDS", "30"))
+
+
+def default_workers() -> int:
+    """Worker count from WEB_CONCURRENCY, otherwise one per core available to this process."""
+    if os.getenv("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+def server_options() -> dict:
+    """uvicorn settings shared by the production launcher and in-process servers."""
+    # uvloop/httptools are optional speedups (pip install .[speedups])
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+        "proxy_headers": True,
+        "timeout_graceful_shutdown": int(DRAIN_TIMEOUT),
+    }
+
+
+def run_production(host: str = "0.0.0.0", port: int = None, workers: int = None):
+    """Run the app with multiple workers, no reloader, and graceful drain on shutdown."""
+    options = server_options()
+    workers = workers or default_workers()
+    port = port or int(os.getenv("PORT", "80"))
+
+    logger.info(
+        f"Starting production server: {workers} workers, loop={options['loop']}, "
+        f"http={options['http']}, drain={DRAIN_TIMEOUT}s"
+    )
+    uvicorn.run("src:app", host=host, port=port, workers=workers, **options)
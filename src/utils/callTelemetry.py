@@ -0,0 +1,183 @@
+import time
+from array import array
+from collections import deque
+from typing import Dict, Any, Optional, List
+
+# Points in the audio path where chunks are timestamped
+VAPI_RECV = 0
+GEMINI_SEND = 1
+GEMINI_FIRST_BYTE = 2
+GEMINI_RECV = 3
+VAPI_SEND = 4
+STAGE_NAMES = ("vapi_recv", "gemini_send", "gemini_first_byte", "gemini_recv", "vapi_send")
+
+
+class CallTelemetry:
+    """Per-call audio timeline kept in fixed-size ring buffers.
+
+    Every chunk costs a few array writes; voice detection looks at a strided
+    view of the PCM samples without copying, so overhead stays negligible
+    next to the audio I/O itself.
+    """
+
+    __slots__ = (
+        "call_id", "started_at", "_started_perf", "capacity", "_stages", "_times", "_sizes", "_next",
+        "_counts", "_bytes", "turn_latencies", "gemini_latencies", "_last_voice_at",
+        "_turn_voice_end", "_awaiting_first_send", "_agent_speaking",
+        "voice_threshold", "reconnects", "reconnect_gap_seconds",
+    )
+
+    def __init__(self, call_id: str, capacity: int = 2048, max_turns: int = 256, voice_threshold: int = 500):
+        self.call_id = call_id
+        self.started_at = time.time()
+        self._started_perf = time.perf_counter()  # origin for sample times, same clock as mark()
+        self.capacity = capacity
+        self._stages = array("B", bytes(capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._sizes = array("I", bytes(array("I").itemsize * capacity))
+        self._next = 0  # total samples written; slot is _next % capacity
+        self._counts = [0] * len(STAGE_NAMES)
+        self._bytes = [0] * len(STAGE_NAMES)
+        # End of user speech -> first agent audio sent to Vapi, and -> first Gemini byte
+        self.turn_latencies: deque = deque(maxlen=max_turns)
+        self.gemini_latencies: deque = deque(maxlen=max_turns)
+        self._last_voice_at: Optional[float] = None
+        self._turn_voice_end: Optional[float] = None
+        self._awaiting_first_send = False
+        self._agent_speaking = False
+        self.voice_threshold = voice_threshold  # peak amplitude of 16-bit PCM counted as speech
+        self.reconnects = 0
+        self.reconnect_gap_seconds = 0.0
+
+    def mark(self, stage: int, size: int, now: Optional[float] = None):
+        """Record one chunk passing a stage."""
+        now = time.perf_counter() if now is None else now
+        slot = self._next % self.capacity
+        self._stages[slot] = stage
+        self._times[slot] = now
+        self._sizes[slot] = size
+        self._next += 1
+        self._counts[stage] += 1
+        self._bytes[stage] += size
+
+    def vapi_received(self, chunk: bytes):
+        now = time.perf_counter()
+        self.mark(VAPI_RECV, len(chunk), now)
+        if len(chunk) >= 2:
+            samples = memoryview(chunk)[: len(chunk) & ~1].cast("h")[::8]
+            if samples and max(max(samples), -min(samples)) >= self.voice_threshold:
+                self._last_voice_at = now
+
+    def gemini_sent(self, size: int):
+        self.mark(GEMINI_SEND, size)
+
+    def gemini_received(self, size: int):
+        now = time.perf_counter()
+        if not self._agent_speaking:
+            # First agent audio of the turn: measured from the last voiced chunk from the caller.
+            # The utterance is consumed here, so an agent turn with no new caller speech isn't timed.
+            self._agent_speaking = True
+            self.mark(GEMINI_FIRST_BYTE, size, now)
+            self._turn_voice_end = self._last_voice_at
+            self._last_voice_at = None
+            if self._turn_voice_end is not None:
+                self.gemini_latencies.append(now - self._turn_voice_end)
+                self._awaiting_first_send = True
+        self.mark(GEMINI_RECV, size, now)
+
+    def vapi_sent(self, size: int):
+        now = time.perf_counter()
+        self.mark(VAPI_SEND, size, now)
+        if self._awaiting_first_send:
+            self._awaiting_first_send = False
+            self.turn_latencies.append(now - self._turn_voice_end)
+
+    def end_turn(self):
+        """Called when Gemini finishes or is interrupted, so the next audio opens a new turn."""
+        self._agent_speaking = False
+
+    def reconnected(self, gap_seconds: float):
+        self.reconnects += 1
+        self.reconnect_gap_seconds += gap_seconds
+
+    def samples(self, limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return buffered samples oldest first, optionally only the newest `limit` or those past index `after`.
+
+        Each sample carries its absolute index (gaps mean the ring wrapped) and
+        its time in ms since the call started, so snapshots can be merged.
+        """
+        first = max(0, self._next - self.capacity)
+        if after is not None:
+            first = max(first, after + 1)
+        if limit:
+            first = max(first, self._next - limit)
+        result = []
+        for i in range(first, self._next):
+            slot = i % self.capacity
+            result.append({
+                "index": i,
+                "stage": STAGE_NAMES[self._stages[slot]],
+                "t_ms": round((self._times[slot] - self._started_perf) * 1000, 2),
+                "bytes": self._sizes[slot],
+            })
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        duration = max(time.time() - self.started_at, 1e-9)
+
+        def latency_stats(values: deque) -> Dict[str, Optional[float]]:
+            ordered = sorted(values)
+            if not ordered:
+                return {"p50": None, "p95": None, "max": None, "last": None}
+
+            def percentile(p: float) -> float:
+                return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 1)
+
+            return {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(ordered[-1] * 1000, 1),
+                "last": round(values[-1] * 1000, 1),
+            }
+
+        return {
+            "call_id": self.call_id,
+            "duration_seconds": round(duration, 2),
+            "stages": {
+                name: {
+                    "chunks": self._counts[i],
+                    "bytes": self._bytes[i],
+                    "bytes_per_second": round(self._bytes[i] / duration, 1),
+                }
+                for i, name in enumerate(STAGE_NAMES)
+            },
+            "turns": len(self.turn_latencies),
+            "turn_latency_ms": latency_stats(self.turn_latencies),
+            "gemini_first_byte_ms": latency_stats(self.gemini_latencies),
+            "reconnects": self.reconnects,
+            "reconnect_gap_ms": round(self.reconnect_gap_seconds * 1000, 1),
+        }
+
+
+class TelemetryRegistry:
+    """Telemetry for active calls plus summaries of recently finished ones."""
+
+    def __init__(self, max_recent: int = 100):
+        self.active: Dict[str, CallTelemetry] = {}
+        self.recent: deque = deque(maxlen=max_recent)
+
+    def start(self, call_id: str) -> CallTelemetry:
+        telemetry = CallTelemetry(call_id)
+        self.active[call_id] = telemetry
+        return telemetry
+
+    def finish(self, call_id: str) -> Optional[Dict[str, Any]]:
+        telemetry = self.active.pop(call_id, None)
+        if not telemetry:
+            return None
+        summary = telemetry.summary()
+        self.recent.append(summary)
+        return summary
+
+
+telemetry_registry = TelemetryRegistry()
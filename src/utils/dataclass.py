@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Optional
 import websockets
 import asyncio
+from src.utils.callTelemetry import CallTelemetry
 
 class CallStatus(Enum):
     INITIALIZING = "initializing"
@@ -21,6 +22,14 @@ class AudioConfig:
     encoding: str = "pcm_s16le"
     container: str = "raw"
 
+@dataclass
+class LiveResumptionState:
+    """Tracks Gemini Live session resumption across reconnects within one call."""
+    handle: Optional[str] = None
+    reconnects: int = 0
+    last_gap_seconds: float = 0.0
+    total_gap_seconds: float = 0.0
+
 @dataclass
 class CallSession:
     """Represents an active call session."""
@@ -30,4 +39,5 @@ class CallSession:
     websocket: Optional[websockets.WebSocketServerProtocol] = None
     gemini_task: Optional[asyncio.Task] = None
     audio_input_queue: Optional[asyncio.Queue] = None
-    audio_output_queue: Optional[asyncio.Queue] = None
\ No newline at end of file
+    audio_output_queue: Optional[asyncio.Queue] = None
+    telemetry: Optional[CallTelemetry] = None
\ No newline at end of file
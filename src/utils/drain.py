@@ -0,0 +1,65 @@
+import time
+import signal
+import asyncio
+import threading
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DrainCoordinator:
+    """Stops new calls as soon as shutdown begins and lets registered agents finish theirs."""
+
+    def __init__(self):
+        self.draining = False
+        self.drain_started_at: Optional[float] = None
+        self.agents: List = []
+
+    def register(self, agent):
+        """Register an object exposing stop_accepting() and async drain(timeout)."""
+        self.agents.append(agent)
+
+    def unregister(self, agent):
+        """Forget an agent once it has shut down."""
+        if agent in self.agents:
+            self.agents.remove(agent)
+
+    def begin(self):
+        if self.draining:
+            return
+        self.draining = True
+        self.drain_started_at = time.monotonic()
+        logger.info(f"Draining: refusing new calls, {len(self.agents)} agents to drain")
+        for agent in self.agents:
+            agent.stop_accepting()
+
+    async def drain(self, timeout: float):
+        """Wait until `timeout` seconds after draining began for active calls, then shut agents down."""
+        self.begin()
+        # The server may already have spent part of the deadline draining HTTP streams
+        remaining = max(0.0, timeout - (time.monotonic() - self.drain_started_at))
+        results = await asyncio.gather(*(agent.drain(remaining) for agent in list(self.agents)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error draining agent: {result}")
+
+    def install_signal_hooks(self):
+        """Start draining on SIGTERM/SIGINT, then hand the signal on to the server's own handler."""
+        if threading.current_thread() is not threading.main_thread():
+            # Signal handlers can only be set from the main thread (e.g. TestClient or an embedded server)
+            logger.info("Not on the main thread; drain will start at lifespan shutdown instead of on signals")
+            return
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(sig)
+            if not callable(previous):
+                continue
+
+            def handler(signum, frame, previous=previous):
+                self.begin()
+                previous(signum, frame)
+
+            signal.signal(sig, handler)
+
+
+drain_coordinator = DrainCoordinator()
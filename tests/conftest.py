@@ -0,0 +1,16 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# The app builds its API clients at import time; give them dummy credentials
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-anthropic-key")
+os.environ.setdefault("VAPI_API_KEY", "test-vapi-key")
+os.environ.setdefault("GOOGLE_API_KEY", "test-google-key")
+os.environ.setdefault("ADMIN_TOKEN", "test-admin-token")
+os.environ.setdefault("VAPI_WEBHOOK_SECRET", "test-vapi-secret")
+os.environ.setdefault("VAPI_EVENT_DB", os.path.join(tempfile.mkdtemp(), "vapi_events.db"))
+os.environ.setdefault("DRAIN_TIMEOUT_SECONDS", "5")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
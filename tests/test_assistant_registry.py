@@ -0,0 +1,88 @@
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+import pytest
+from src.componenets.assistants.assistantRegistry import AssistantRegistry, compile_assistant
+from src.componenets.customLLMs.gpt4o import OpenAIgpt4o
+from src.componenets.geminiLive.geminiLiveAgent import GeminiClient
+
+
+def write_config(path, model, mtime):
+    path.write_text(json.dumps({
+        "default": "demo",
+        "assistants": {"demo": {"model": model, "system_prompt": "Be brief.", "sampling": {"temperature": 0.2}}},
+    }))
+    os.utime(path, (mtime, mtime))
+
+
+def test_reload_swaps_snapshot_without_touching_held_assistants(tmp_path):
+    config = tmp_path / "assistants.json"
+    write_config(config, "gpt-4o", 1_000)
+    registry = AssistantRegistry(str(config))
+    held = registry.get()
+
+    write_config(config, "gpt-4.1", 2_000)
+    assert registry.reload()
+    assert registry.get().model == "gpt-4.1"
+    assert held.model == "gpt-4o"
+
+    config.write_text("{not json")
+    os.utime(config, (3_000, 3_000))
+    assert not registry.reload()
+    assert registry.get().model == "gpt-4.1"
+
+
+def test_request_model_does_not_override_assistant_model():
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(content=b"{}")
+
+    agent = OpenAIgpt4o()
+    agent.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        with_raw_response=SimpleNamespace(create=create)
+    )))
+    request = {
+        "model": "vapi-configured-model",
+        "stream": False,
+        "temperature": 0.7,
+        "messages": [{"role": "user", "content": "hi"}],
+        "call": {"id": "call-1"},
+    }
+    asyncio.run(agent.openai_sse_chat_completions(request))
+
+    assert calls[0]["model"] == "gpt-4o"
+    assert calls[0]["temperature"] == 0.7
+    assert calls[0]["messages"][0]["role"] == "system"
+    assert "call" not in calls[0]
+
+
+@pytest.mark.parametrize("assistant_id", ["gemini-live-demo", {"id": "demo-product-agent"}])
+def test_chat_completion_rejects_assistants_it_cannot_serve(assistant_id):
+    agent = OpenAIgpt4o()
+    request = {"assistant_id": assistant_id, "stream": False, "messages": [{"role": "user", "content": "hi"}]}
+    response = asyncio.run(agent.openai_sse_chat_completions(request))
+    assert response.status_code == 400
+
+
+def test_gemini_assistant_sampling_reaches_live_config():
+    assistant = compile_assistant("live", {
+        "provider": "gemini",
+        "model": "models/gemini-live",
+        "sampling": {"temperature": 0.3, "max_tokens": 256, "seed": 7},
+    })
+    config = GeminiClient(api_key="test-google-key")._build_config(assistant, None)
+    assert (config.temperature, config.max_output_tokens, config.seed) == (0.3, 256, 7)
+
+    with pytest.raises(ValueError):
+        compile_assistant("live", {"provider": "gemini", "model": "m", "sampling": {"frequency_penalty": 1}})
+    with pytest.raises(ValueError):
+        compile_assistant("live", {"provider": "gemini", "model": "m", "tools": [{"type": "function"}]})
+
+
+def test_gemini_client_rejects_non_gemini_assistant():
+    client = GeminiClient(api_key="test-google-key", assistant_id="demo-product-agent")
+    with pytest.raises(ValueError):
+        asyncio.run(client.run_session(lambda: None, lambda data: None))
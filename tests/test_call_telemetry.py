@@ -0,0 +1,69 @@
+import time
+from array import array
+from fastapi.testclient import TestClient
+from src import app
+from src.utils.callTelemetry import CallTelemetry
+
+SPEECH = array("h", [3000, -3000] * 160).tobytes()
+SILENCE = bytes(640)
+
+
+def test_turn_latency_runs_from_end_of_speech_to_first_audio_sent():
+    telemetry = CallTelemetry("call-1")
+    telemetry.vapi_received(SPEECH)
+    telemetry.vapi_received(SILENCE)
+    time.sleep(0.05)
+    telemetry.gemini_received(960)
+    telemetry.vapi_sent(960)
+    telemetry.vapi_sent(960)
+    telemetry.end_turn()
+
+    assert len(telemetry.turn_latencies) == 1
+    assert len(telemetry.gemini_latencies) == 1
+    assert 0.05 <= telemetry.turn_latencies[0] < 0.5
+
+
+def test_agent_turn_without_new_caller_speech_is_not_timed():
+    telemetry = CallTelemetry("call-1")
+    telemetry.vapi_received(SPEECH)
+    telemetry.gemini_received(960)
+    telemetry.vapi_sent(960)
+    telemetry.end_turn()
+
+    # Gemini speaks again with only silence from the caller in between
+    telemetry.vapi_received(SILENCE)
+    time.sleep(0.05)
+    telemetry.gemini_received(960)
+    telemetry.vapi_sent(960)
+
+    assert len(telemetry.turn_latencies) == 1
+    assert telemetry.summary()["turns"] == 1
+
+
+def test_admin_routes_require_token():
+    client = TestClient(app)
+    assert client.get("/admin/calls/telemetry").status_code == 401
+    assert client.get("/admin/calls/telemetry", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    response = client.get("/admin/calls/telemetry", headers={"X-Admin-Token": "test-admin-token"})
+    assert response.status_code == 200
+    assert set(response.json()) == {"active", "recent"}
+
+
+def test_samples_carry_absolute_index_and_resume_after_last_sent():
+    telemetry = CallTelemetry("call-1", capacity=8)
+    for _ in range(5):
+        telemetry.gemini_sent(320)
+    first = telemetry.samples(limit=3)
+    assert [s["index"] for s in first] == [2, 3, 4]
+
+    for _ in range(6):
+        telemetry.vapi_sent(960)
+    # Only samples past the last one sent; indexes 5-10 are all still in the ring
+    newer = telemetry.samples(after=first[-1]["index"])
+    assert [s["index"] for s in newer] == [5, 6, 7, 8, 9, 10]
+    assert all(s["stage"] == "vapi_send" for s in newer)
+    times = [s["t_ms"] for s in first + newer]
+    assert times == sorted(times) and times[0] >= 0
+
+    # A consumer that fell behind the ring sees the gap in the indexes
+    assert telemetry.samples(after=0)[0]["index"] == 3
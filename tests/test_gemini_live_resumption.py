@@ -0,0 +1,135 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+import pytest
+from google.genai import types
+from src.componenets.geminiLive.geminiLiveAgent import GeminiClient
+
+DROP = object()
+
+
+class FakeLiveSession:
+    """One Live connection that hands out a resumption handle and then drops or sends go-away."""
+
+    def __init__(self, handle: str = None, drop_after: int = None, go_away_after: int = None):
+        self.received = []
+        self.outgoing = asyncio.Queue()
+        self.closed = False
+        self.drop_after = drop_after
+        self.go_away_after = go_away_after
+        if handle is None:
+            # Rejects the connection (e.g. an expired handle) before sending anything
+            self.outgoing.put_nowait(DROP)
+        else:
+            self.outgoing.put_nowait(types.LiveServerMessage(
+                session_resumption_update=types.LiveServerSessionResumptionUpdate(new_handle=handle, resumable=True)
+            ))
+
+    async def send_realtime_input(self, audio):
+        # Yield first so a cancellation can land mid-send, like a real network write
+        await asyncio.sleep(0.005)
+        if self.closed:
+            raise ConnectionError("connection dropped")
+        self.received.append(audio.data)
+        if len(self.received) == self.drop_after:
+            self.closed = True
+            self.outgoing.put_nowait(DROP)
+        if len(self.received) == self.go_away_after:
+            self.outgoing.put_nowait(types.LiveServerMessage(go_away=types.LiveServerGoAway(time_left="1s")))
+
+    async def receive(self):
+        while True:
+            message = await self.outgoing.get()
+            if message is DROP:
+                raise ConnectionError("connection dropped")
+            yield message
+
+
+class FakeLiveServer:
+    """Stands in for client.aio.live: drops the first connection, sends go-away on the second."""
+
+    def __init__(self, sessions=None):
+        self.handles = []
+        self.sessions = sessions or [
+            FakeLiveSession("handle-1", drop_after=3),
+            FakeLiveSession("handle-2", go_away_after=3),
+            FakeLiveSession("handle-3"),
+        ]
+
+    @asynccontextmanager
+    async def connect(self, model, config):
+        self.handles.append(config.session_resumption.handle)
+        yield self.sessions[min(len(self.handles), len(self.sessions)) - 1]
+
+
+def make_client(server, **kwargs):
+    client = GeminiClient(api_key="test-google-key", reconnect_delay=0.05, **kwargs)
+    client.client = SimpleNamespace(aio=SimpleNamespace(live=server))
+    return client
+
+
+async def mic_audio(chunks, delay=0.01):
+    for chunk in chunks:
+        yield chunk
+        await asyncio.sleep(delay)
+
+
+def test_session_resumes_with_latest_handle_and_keeps_audio_in_order():
+    server = FakeLiveServer()
+    client = make_client(server)
+    chunks = [bytes([i]) * 320 for i in range(12)]
+    gaps = []
+
+    asyncio.run(asyncio.wait_for(
+        client.run_session(lambda: mic_audio(chunks), lambda data: None, on_reconnect=gaps.append), 5
+    ))
+
+    # Each reconnect presents the handle from the connection before it
+    assert server.handles == [None, "handle-1", "handle-2"]
+    # Audio buffered during the gaps arrives once each and in order
+    sent = [chunk for session in server.sessions for chunk in session.received]
+    assert sent == chunks
+    assert len(server.sessions[2].received) > 0
+    # The reconnect gap is reported for both drops
+    assert len(gaps) == 2
+    assert all(gap >= 0.05 for gap in gaps)
+
+
+def test_rejected_resume_starts_a_fresh_session():
+    server = FakeLiveServer([
+        FakeLiveSession("handle-1", drop_after=3),
+        FakeLiveSession(),  # rejects handle-1
+        FakeLiveSession("handle-2"),
+    ])
+    client = make_client(server)
+    chunks = [bytes([i]) * 320 for i in range(8)]
+
+    asyncio.run(asyncio.wait_for(client.run_session(lambda: mic_audio(chunks), lambda data: None), 5))
+
+    assert server.handles == [None, "handle-1", None]
+
+
+def test_connections_dropped_before_any_message_count_towards_max_reconnects():
+    server = FakeLiveServer([FakeLiveSession() for _ in range(10)])
+    client = make_client(server, max_reconnects=3)
+    chunks = [bytes(320)] * 100
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(asyncio.wait_for(client.run_session(lambda: mic_audio(chunks), lambda data: None), 5))
+    assert len(server.handles) == 3
+
+
+def test_cancelled_session_leaves_no_tasks_behind():
+    server = FakeLiveServer([FakeLiveSession("handle-1")])
+    client = make_client(server)
+
+    async def run():
+        session = asyncio.create_task(
+            client.run_session(lambda: mic_audio([bytes(320)] * 100), lambda data: None)
+        )
+        await asyncio.sleep(0.1)
+        session.cancel()
+        await asyncio.gather(session, return_exceptions=True)
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
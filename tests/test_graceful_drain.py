@@ -0,0 +1,167 @@
+import asyncio
+import json
+import os
+import signal
+import time
+from types import SimpleNamespace
+import httpx
+import pytest
+import uvicorn
+import websockets
+from fastapi.testclient import TestClient
+from src import app
+from src.componenets.assistants.assistantRegistry import assistant_registry
+from src.componenets.vapiAI.vapiEventStore import event_store
+from src.routes import gptRouter
+from src.server import DRAIN_TIMEOUT, server_options
+from src.utils.drain import drain_coordinator
+from src.componenets.vapiAI.vapiSDK import VapiWebSocketAgent
+
+SSE_CLIENTS = 20
+STREAM_CHUNKS = 15
+CHUNK_DELAY = 0.1
+CALL_AUDIO_CHUNKS = 25
+
+
+class FakeCompletionStream:
+    """Upstream OpenAI stream that trickles out chunks so SSE responses stay open for a while."""
+
+    def __init__(self):
+        self.sent = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.sent == STREAM_CHUNKS:
+            raise StopAsyncIteration
+        await asyncio.sleep(CHUNK_DELAY)
+        self.sent += 1
+        payload = json.dumps({"index": self.sent})
+        return SimpleNamespace(model_dump_json=lambda: payload)
+
+
+class FakeGemini:
+    """Echoes caller audio back, standing in for a Gemini Live session."""
+
+    async def run_session(self, mic_audio_gen, on_audio_out, **callbacks):
+        async for pcm in mic_audio_gen():
+            on_audio_out(pcm)
+
+
+async def sse_client(port: int, results: list):
+    try:
+        async with httpx.AsyncClient(timeout=DRAIN_TIMEOUT * 2) as client:
+            async with client.stream(
+                "POST",
+                f"http://127.0.0.1:{port}/custom-llm-test/chat/completions",
+                json={"stream": True, "messages": [{"role": "user", "content": "hi"}]},
+            ) as response:
+                events = [line async for line in response.aiter_lines() if line.startswith("data: ")]
+        results.append(len(events) == STREAM_CHUNKS)
+    except httpx.HTTPError:
+        results.append(False)
+
+
+def test_sigterm_drains_streams_and_calls_without_drops(monkeypatch):
+    async def create_stream(**kwargs):
+        return FakeCompletionStream()
+
+    monkeypatch.setattr(
+        gptRouter.gpt4o_agent,
+        "client",
+        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create_stream))),
+    )
+    completed_calls = []
+
+    async def fake_vapi_call(ws):
+        # Plays caller audio for a while, then ends the call from Vapi's side,
+        # reading the agent's audio the whole time like the real service
+        async def consume_agent_audio():
+            async for _ in ws:
+                pass
+
+        reader = asyncio.create_task(consume_agent_audio())
+        for _ in range(CALL_AUDIO_CHUNKS):
+            await ws.send(bytes(640))
+            await asyncio.sleep(CHUNK_DELAY)
+        await ws.send(json.dumps({"type": "call-ended"}))
+        completed_calls.append(True)
+        await reader
+
+    async def run():
+        vapi_server = await websockets.serve(fake_vapi_call, "127.0.0.1", 0)
+        vapi_port = vapi_server.sockets[0].getsockname()[1]
+
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", **server_options()))
+        serve_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+
+        agent = VapiWebSocketAgent(assistant_id="assistant-1")
+        agent.gemini = FakeGemini()
+
+        async def create_call(**kwargs):
+            return SimpleNamespace(id="call-1", transport={"websocketCallUrl": f"ws://127.0.0.1:{vapi_port}"})
+
+        agent.vapi = SimpleNamespace(calls=SimpleNamespace(create=create_call))
+        assert await agent.start_call() == "call-1"
+
+        results = []
+        clients = [asyncio.create_task(sse_client(port, results)) for _ in range(SSE_CLIENTS)]
+        await asyncio.sleep(0.5)
+
+        # Restart signal arrives while every stream and the call are mid-flight
+        signal_at = time.monotonic()
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0.05)
+        refused_call = await agent.start_call()
+
+        await asyncio.wait_for(serve_task, timeout=DRAIN_TIMEOUT + 2)
+        drain_seconds = time.monotonic() - signal_at
+        await asyncio.gather(*clients)
+        vapi_server.close()
+        await vapi_server.wait_closed()
+        return results, refused_call, drain_seconds, agent
+
+    # uvicorn re-raises the captured signal on exit; make sure that lands on a no-op
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    try:
+        results, refused_call, drain_seconds, agent = asyncio.run(run())
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        drain_coordinator.draining = False
+        drain_coordinator.drain_started_at = None
+
+    dropped_streams = results.count(False)
+    assert len(results) == SSE_CLIENTS
+    assert dropped_streams == 0
+    assert completed_calls == [True]
+    assert refused_call is None
+    assert drain_seconds < DRAIN_TIMEOUT
+    assert not agent.session_tasks
+    assert agent not in drain_coordinator.agents
+
+
+def test_lifespan_runs_off_the_main_thread():
+    # TestClient runs the app's lifespan in a worker thread, where signal handlers can't be installed
+    try:
+        with TestClient(app) as client:
+            assert event_store.running
+            assert client.get("/health").json() == {"status": "ok"}
+        assert not event_store.running
+    finally:
+        drain_coordinator.draining = False
+        drain_coordinator.drain_started_at = None
+
+
+def test_failed_startup_stops_what_it_started(monkeypatch):
+    def fail():
+        raise RuntimeError("watcher failed")
+
+    monkeypatch.setattr(assistant_registry, "start_watching", fail)
+    with pytest.raises(RuntimeError):
+        with TestClient(app):
+            pass
+    assert not event_store.running
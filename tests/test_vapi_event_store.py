@@ -0,0 +1,82 @@
+import asyncio
+import json
+import httpx
+from fastapi.testclient import TestClient
+from src import app
+from src.routes import vapiRouter
+from src.componenets.vapiAI.vapiEventStore import VapiEventStore, event_store
+from src.componenets.vapiAI.vapiSDK import VapiWebSocketAgent
+from src.utils.drain import drain_coordinator
+
+WEBHOOK_HEADERS = {"X-Vapi-Secret": "test-vapi-secret"}
+
+
+def test_query_before_start_returns_no_events(tmp_path):
+    store = VapiEventStore(db_path=str(tmp_path / "events.db"))
+    assert asyncio.run(store.query(call_id="call-1")) == []
+
+
+def test_batched_events_are_queryable_by_call_and_time_range(tmp_path):
+    async def run():
+        store = VapiEventStore(db_path=str(tmp_path / "events.db"), batch_size=50)
+        await store.start()
+        for i in range(1000):
+            message = {"type": "status-update", "call": {"id": f"call-{i % 4}"}, "timestamp": 1_700_000_000_000 + i}
+            assert store.enqueue_message(message)
+        await store.stop()
+        return await store.query(call_id="call-1", start=1_700_000_000.0, end=1_700_000_000.1)
+
+    events = asyncio.run(run())
+    assert len(events) == 25
+    assert {event["call_id"] for event in events} == {"call-1"}
+    assert [event["timestamp"] for event in events] == sorted(event["timestamp"] for event in events)
+
+
+def test_event_query_limit_is_bounded():
+    client = TestClient(app, headers={"X-Admin-Token": "test-admin-token"})
+    assert client.get("/vapi/events", params={"limit": -1}).status_code == 422
+    assert client.get("/vapi/events", params={"limit": 10_001}).status_code == 422
+
+
+def test_event_routes_require_credentials():
+    client = TestClient(app)
+    assert client.get("/vapi/events").status_code == 401
+    assert client.get("/vapi/calls/call-1/events", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.post("/vapi/webhook", json={"message": {"type": "status-update"}}).status_code == 401
+    assert client.post(
+        "/vapi/webhook", json={"message": {"type": "status-update"}}, headers={"X-Vapi-Secret": "wrong"}
+    ).status_code == 401
+
+
+def test_agent_persists_to_app_event_store_by_default():
+    agent = VapiWebSocketAgent(assistant_id="assistant-1")
+    assert agent.event_store is event_store
+    drain_coordinator.unregister(agent)
+
+
+def test_webhook_acks_and_stores_the_bare_message(monkeypatch, tmp_path):
+    store = VapiEventStore(db_path=str(tmp_path / "events.db"))
+    monkeypatch.setattr(vapiRouter, "event_store", store)
+    message = {"type": "end-of-call-report", "call": {"id": "call-1"}, "timestamp": 1_700_000_000_000}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=WEBHOOK_HEADERS) as client:
+            not_started = await client.post("/vapi/webhook", json={"message": message})
+            await store.start()
+            accepted = await client.post("/vapi/webhook", json={"message": message})
+            utf16 = await client.post("/vapi/webhook", content=json.dumps({"message": message}).encode("utf-16"))
+            not_json = await client.post("/vapi/webhook", content=b"{not json")
+            await store.stop()
+        return not_started, accepted, utf16, not_json, await store.query(call_id="call-1")
+
+    not_started, accepted, utf16, not_json, events = asyncio.run(run())
+    assert not_started.status_code == 503
+    assert not_started.json() == {"error": "Event store not running"}
+    assert accepted.status_code == 200
+    assert accepted.json() == {"status": "accepted"}
+    assert utf16.status_code == 400
+    assert not_json.status_code == 400
+    assert len(events) == 1
+    assert events[0]["type"] == "end-of-call-report"
+    assert events[0]["payload"] == message